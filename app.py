@@ -1,14 +1,74 @@
+import atexit
+import hashlib
 import re
+import shutil
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 import gradio as gr
-import markdown
+from markdown_it import MarkdownIt
 
 from ai_blog_generator.agents import BlogAgents
 from ai_blog_generator.generator import BlogPostGenerator
 from ai_blog_generator.model import Model
 from ai_blog_generator.utils import custom_css, get_default_llm
 
+# Minimum seconds between re-renders of the partially streamed post
+STREAM_RENDER_INTERVAL = 0.2
+
+# Markdown downloads are written to one private directory that is removed on exit
+DOWNLOAD_DIR = tempfile.mkdtemp(prefix="ai-blog-generator-")
+atexit.register(shutil.rmtree, DOWNLOAD_DIR, ignore_errors=True)
+
+# Markdown rendering and download writes run off the request thread
+RENDER_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="render")
+
+markdown_renderer = MarkdownIt("commonmark")
+
+
+@lru_cache(maxsize=8)
+def render_markdown(text: str) -> str:
+    """Render markdown to HTML, reusing recent renders of identical text"""
+    return markdown_renderer.render(text)
+
+
+def write_download(markdown_output: str) -> str:
+    """Write the post to a markdown file for the download button and return its path"""
+    with tempfile.NamedTemporaryFile(
+        mode="w", prefix="blog-", suffix=".md", dir=DOWNLOAD_DIR, delete=False, encoding="utf-8"
+    ) as temp_file:
+        temp_file.write(markdown_output)
+        return temp_file.name
+
+
+# Model clients (and their connection pools) are reused across requests. The workflow and its agents are
+# built per request: agno keeps each run's session, run state and memory on them
+MODEL_CACHE_SIZE = 8
+_models: OrderedDict[tuple[str, str, str], Model] = OrderedDict()
+_models_lock = threading.Lock()
+
+
+def get_model(llm_provider: str, llm_name: str, api_key: str) -> Model:
+    """Get a cached model for the provider, model name and API key, creating it if needed"""
+    # Key on a hash so raw API keys are never kept as cache keys
+    key = (llm_provider, llm_name, hashlib.sha256((api_key or "").encode("utf-8")).hexdigest())
+    with _models_lock:
+        llm = _models.get(key)
+        if llm is not None:
+            _models.move_to_end(key)
+            return llm
+    llm = Model(llm_provider, llm_name, api_key)
+    with _models_lock:
+        _models[key] = llm
+        if len(_models) > MODEL_CACHE_SIZE:
+            _models.popitem(last=False)
+    return llm
+
 
 def generate_blog(llm_provider, llm_name, api_key, user_topic, style_guidelines, include_sources):
     if not api_key:
@@ -17,12 +77,11 @@ def generate_blog(llm_provider, llm_name, api_key, user_topic, style_guidelines,
         gr.Warning("Please enter a model name.")
     if not user_topic or user_topic.strip() == "":
         gr.Warning("Please enter a blog topic or ideas for the topic.")
-        return gr.update(value="", visible=True), "", gr.update(value=None, visible=False)
+        yield gr.update(value="", visible=True), "", gr.update(value=None, visible=False)
+        return
     url_safe_topic = re.sub(r"\s+", "-", user_topic.strip().lower())
-    llm = Model(llm_provider, llm_name, api_key)
-    blog_agents = BlogAgents(llm)
     generate_blog_post = BlogPostGenerator(
-        blog_agents=blog_agents,
+        blog_agents=BlogAgents(get_model(llm_provider, llm_name, api_key)),
         session_id=f"generate-blog-post-on-{url_safe_topic}",
         debug_mode=True,
     )
@@ -32,29 +91,39 @@ def generate_blog(llm_provider, llm_name, api_key, user_topic, style_guidelines,
         include_sources=include_sources,
     )
     final_output = ""
-    sources = set()
+    # Insertion-ordered so sources are listed in the order they were cited
+    sources: dict[str, None] = {}
+    last_render = time.monotonic()
+    # Partial renders run on the render pool so the writer stream keeps draining meanwhile
+    pending_render: Optional[Future] = None
     for response in blog_post:
         if hasattr(response, "content") and response.content:
             final_output += str(response.content) + "\n"
         if hasattr(response, "sources") and response.sources:
             if isinstance(response.sources, (list, set)):
-                sources.update(response.sources)
+                sources.update(dict.fromkeys(map(str, response.sources)))
             else:
-                sources.add(str(response.sources))
+                sources[str(response.sources)] = None
+        if pending_render is not None and pending_render.done():
+            partial_html = pending_render.result()
+            pending_render = None
+            yield gr.update(value=f"<div>{partial_html}</div>", visible=True), "", gr.update(visible=False)
+        # Show the post as it is being written, throttled to keep rendering cheap
+        if pending_render is None and final_output and time.monotonic() - last_render >= STREAM_RENDER_INTERVAL:
+            last_render = time.monotonic()
+            pending_render = RENDER_EXECUTOR.submit(render_markdown, final_output)
 
     markdown_output = final_output
     if include_sources and sources:
         markdown_output += "\n\n## Sources\n"
-        markdown_output += "\n".join(f"- {src}" for src in sorted(sources))
-    html_body = markdown.markdown(markdown_output)
-    html_content = f"<div>{html_body}</div>"
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False, encoding="utf-8") as temp_file:
-        temp_file.write(markdown_output)
-        download_path = temp_file.name
-    return (
-        gr.update(value=html_content, visible=True),
+        markdown_output += "\n".join(f"- {src}" for src in sources)
+    # Render the final post and write the download file in parallel
+    html_future = RENDER_EXECUTOR.submit(render_markdown, markdown_output)
+    download_future = RENDER_EXECUTOR.submit(write_download, markdown_output)
+    yield (
+        gr.update(value=f"<div>{html_future.result()}</div>", visible=True),
         "",
-        gr.update(value=download_path, visible=True),
+        gr.update(value=download_future.result(), visible=True),
     )
 
 
@@ -1,23 +1,45 @@
+import asyncio
+import base64
+import binascii
 import html
-import json
+import random
 import re
 import time
+from difflib import SequenceMatcher
 from textwrap import dedent
-from typing import Dict, Iterator, Optional
-from urllib.parse import quote_plus
-from urllib.request import Request, urlopen
-from xml.etree import ElementTree
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import quote_plus, urlsplit, urlunsplit
 
+import httpx
+import lxml.etree
+import lxml.html
+import orjson
 from agno.utils.log import logger
 from agno.workflow import RunResponse, Workflow
+from cachetools import TTLCache
 
+from ai_blog_generator.agents import ArticleScraperAgent
+from ai_blog_generator.http_client import get_http_client, run_on_io_loop, run_sync
 from ai_blog_generator.response_model import NewsArticle, ScrapedArticle, SearchResults
 
+_CONTROL_CHARS = "".join(chr(c) for c in (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F))
+_CONTROL_OR_SPACE_RE = re.compile(r"[\s\x00-\x08\x0b\x0c\x0e-\x1f\x7f]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_HREF_RE = re.compile(r"""<a\s[^>]*?href=["']([^"']+)["']""", re.IGNORECASE)
+_GOOGLE_NEWS_HOST = "news.google.com"
+_TRACKING_PARAMS = frozenset(
+    {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid", "mc_cid", "mc_eid"}
+)
+# Validators and parsed articles of recently fetched feeds, keyed by (feed URL, max_results), so
+# repeat searches can be answered with a 304; only touched from the shared I/O loop
+_FEED_CACHE: TTLCache[Tuple[str, int], Tuple[Optional[str], Optional[str], Tuple[NewsArticle, ...]]] = TTLCache(
+    maxsize=256, ttl=30 * 86400
+)
+# Scrapes from earlier runs, keyed by canonical URL and shared by every generator in the process;
+# only touched from the shared I/O loop. Expires with the scraper's disk cache so both agree on freshness
+_SCRAPE_CACHE: TTLCache[str, ScrapedArticle] = TTLCache(maxsize=2048, ttl=ArticleScraperAgent.cache_ttl_seconds)
 
-class BlogPostGenerator(Workflow):
-    """Advanced workflow for generating professional blog posts with proper research and citations."""
-
-    description: str = dedent("""\
+_DESCRIPTION = dedent("""\
     An intelligent blog post generator that creates engaging, well-researched content.
     This workflow orchestrates multiple AI agents to research, analyze, and craft
     compelling blog posts that combine journalistic rigor with engaging storytelling.
@@ -25,15 +47,100 @@ class BlogPostGenerator(Workflow):
     digital consumption.
     """)
 
-    def __init__(self, blog_agents, *args, **kwargs):
+
+def _clean_text(text: Optional[str]) -> Optional[str]:
+    # Most feed text is plain, so only decode entities or parse markup when it's actually there
+    if text is None:
+        return None
+    if "<" in text:
+        # One C-level parse decodes entities and drops tags
+        try:
+            text = lxml.html.fragment_fromstring(text, create_parent="div").text_content()
+        except (ValueError, lxml.etree.ParserError):
+            text = _TAG_RE.sub("", html.unescape(text))
+    elif "&" in text:
+        text = html.unescape(text)
+    return text.strip() or None
+
+
+def _canonical_url(url: str) -> str:
+    # Tracking parameters, fragments, host case and trailing slashes don't change the article,
+    # so they shouldn't defeat deduplication
+    parts = urlsplit(url.strip())
+    query = "&".join(
+        param
+        for param in parts.query.split("&")
+        if param and (name := param.split("=", 1)[0]) not in _TRACKING_PARAMS and not name.startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def _publisher_url(link: str, description: Optional[str]) -> str:
+    """Resolve a Google News redirector link to the publisher URL when that's possible offline."""
+    parts = urlsplit(link)
+    if parts.hostname != _GOOGLE_NEWS_HOST:
+        return link
+    # Older article ids are base64 protobufs that embed the target URL right after a short header
+    article_id = parts.path.rsplit("/", 1)[-1]
+    try:
+        data = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        data = b""
+    if data.startswith(b"\x08\x13\x22") and len(data) > 4:
+        length, start = data[3], 4
+        if length & 0x80 and len(data) > 5:
+            length, start = (length & 0x7F) | (data[4] << 7), 5
+        url = data[start : start + length].decode("utf-8", "replace")
+        if url.startswith(("https://", "http://")):
+            return url
+    # Otherwise use the description's link unless it points back at the redirector
+    if description and (match := _HREF_RE.search(description)):
+        href = html.unescape(match.group(1))
+        if href.startswith(("https://", "http://")) and urlsplit(href).hostname != _GOOGLE_NEWS_HOST:
+            return href
+    return link
+
+
+def _collapse_control_or_space(match: re.Match) -> str:
+    # Control characters are dropped; any run that still contains whitespace becomes one space
+    return " " if match.group().strip(_CONTROL_CHARS) else ""
+
+
+class BlogPostGenerator(Workflow):
+    """Advanced workflow for generating professional blog posts with proper research and citations."""
+
+    description: str = _DESCRIPTION
+
+    # Upper bound on simultaneous article downloads
+    max_concurrent_scrapes: int = 8
+    # Seconds after which failed searches are no longer retried
+    search_retry_deadline: float = 10.0
+    # Seconds to wait for the RSS search before hedging with a second request
+    search_hedge_delay: float = 2.0
+    # Bytes read from the RSS response per parser feed
+    rss_read_size: int = 16 * 1024
+    # Article body characters sent to the writer (roughly 500 tokens)
+    max_article_chars: int = 2000
+    # RSS summaries sent to the writer when no article could be scraped
+    max_fallback_articles: int = 5
+    # Similarity above which two article openings count as the same story
+    near_duplicate_ratio: float = 0.85
+    # Word overlap above which the speculative topic search is reused for the planned query
+    similar_query_overlap: float = 0.7
+    # Word limit the query planner is instructed to keep its search queries under
+    planned_query_max_words: int = 12
+
+    def __init__(self, blog_agents, *args, http_client: Optional[httpx.AsyncClient] = None, **kwargs):
         super().__init__(*args, **kwargs)
+        # Search and scraping share one pool so repeat hosts reuse warm connections; an injected
+        # client must be usable from the shared I/O loop that run_sync drives
+        self.http_client = http_client or get_http_client()
         self.article_scraper = blog_agents.article_scraper_agent
         self.query_planner = blog_agents.query_planner_agent
         self.writer = blog_agents.writer_agent
 
     def _sanitize_user_text(self, text: str, max_length: int = 1200) -> str:
-        cleaned = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text or "")
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _CONTROL_OR_SPACE_RE.sub(_collapse_control_or_space, text or "").strip()
         return cleaned[:max_length]
 
     def _should_use_query_planner(self, raw_topic: str) -> bool:
@@ -43,13 +150,12 @@ class BlogPostGenerator(Workflow):
         if not self.query_planner or not self._should_use_query_planner(raw_topic):
             return cleaned_topic
         try:
-            planner_input = json.dumps(
+            planner_input = orjson.dumps(
                 {
                     "topic": cleaned_topic,
                     "style_guidelines": style_guidelines,
-                },
-                indent=2,
-            )
+                }
+            ).decode()
             response: RunResponse = self.query_planner.run(planner_input)
             if response and response.content:
                 query = self._sanitize_user_text(str(response.content), max_length=200)
@@ -60,61 +166,109 @@ class BlogPostGenerator(Workflow):
             logger.warning(f"Failed to generate search query: {exc}")
         return cleaned_topic
 
-    def _search_google_news_rss(self, topic: str, max_results: int = 10) -> SearchResults:
+    async def _search_google_news_rss(self, topic: str, max_results: int = 10) -> SearchResults:
         query = quote_plus(topic)
         url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
-        request = Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; AI-Blog-Generator/1.0; +https://example.com)"
-            },
-        )
-        with urlopen(request, timeout=10) as response:
-            feed = response.read().decode("utf-8")
+
+        cache_key = (url, max_results)
+        cached_feed = _FEED_CACHE.get(cache_key)
+        headers = {}
+        if cached_feed is not None:
+            etag, last_modified, _ = cached_feed
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         articles: list[NewsArticle] = []
         seen_urls: set[str] = set()
-        try:
-            root = ElementTree.fromstring(feed)
-            items = root.findall(".//item")
-            for item in items:
-                title = item.findtext("title")
-                link = item.findtext("link")
-                description = item.findtext("description")
-                if not title or not link:
-                    continue
-                title = html.unescape(title).strip()
-                url = link.strip()
-                summary_raw = html.unescape(description).strip() if description else None
-                summary = re.sub(r"<[^>]+>", "", summary_raw).strip() if summary_raw else None
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
-                articles.append(NewsArticle(title=title, url=url, summary=summary))
-                if len(articles) >= max_results:
-                    break
-        except ElementTree.ParseError:
-            items = re.findall(r"<item>(.*?)</item>", feed, flags=re.DOTALL)
-            for item in items:
-                title_match = re.search(r"<title><!\\[CDATA\\[(.*?)\\]\\]></title>", item)
-                link_match = re.search(r"<link>(.*?)</link>", item)
-                desc_match = re.search(r"<description><!\\[CDATA\\[(.*?)\\]\\]></description>", item)
-                title = html.unescape(title_match.group(1)).strip() if title_match else None
-                url = link_match.group(1).strip() if link_match else None
-                summary_raw = html.unescape(desc_match.group(1)).strip() if desc_match else None
-                summary = re.sub(r"<[^>]+>", "", summary_raw).strip() if summary_raw else None
-                if not url or not title or url in seen_urls:
-                    continue
-                seen_urls.add(url)
-                articles.append(NewsArticle(title=title, url=url, summary=summary))
-                if len(articles) >= max_results:
-                    break
+        add_article = articles.append
+        seen_add = seen_urls.add
+        complete = True
+        async with self.http_client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached_feed is not None:
+                logger.info(f"RSS feed not modified, reusing {len(cached_feed[2])} cached articles")
+                return SearchResults(articles=list(cached_feed[2]))
+            response.raise_for_status()
+            logger.debug(f"Fetching RSS feed over {response.http_version}")
+            # The feed is untrusted input, so never expand entities or fetch external resources
+            parser = lxml.etree.XMLPullParser(events=("end",), tag="item", resolve_entities=False, no_network=True)
+
+            def collect_items() -> bool:
+                """Turn the parsed items into articles; returns True once there are enough."""
+                for _, item in parser.read_events():
+                    title = _clean_text(item.findtext("title"))
+                    link = item.findtext("link")
+                    description = item.findtext("description")
+                    summary = _clean_text(description)
+                    # Free the item and the already processed siblings before it
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
+                    if not title or not link:
+                        continue
+                    # Link straight to the publisher so scrapes skip the redirect hop
+                    url = _publisher_url(link.strip(), description)
+                    # One hash lookup instead of a membership test followed by add()
+                    seen_count = len(seen_urls)
+                    seen_add(_canonical_url(url))
+                    if len(seen_urls) == seen_count:
+                        continue
+                    add_article(NewsArticle(title=title, url=url, summary=summary))
+                    if len(articles) >= max_results:
+                        return True
+                return False
+
+            try:
+                # Parse items as they arrive and stop reading once we have enough
+                async for chunk in response.aiter_bytes(self.rss_read_size):
+                    parser.feed(chunk)
+                    if collect_items():
+                        break
+                else:
+                    # lxml reports some syntax errors only once the document is closed
+                    parser.close()
+                    collect_items()
+            except lxml.etree.ParseError as exc:
+                # feed() raises before the chunk's complete items are read, so collect them first;
+                # only fail if the feed had no usable items before the malformed section
+                collect_items()
+                if not articles:
+                    raise
+                logger.warning(f"Stopped reading malformed RSS feed after {len(articles)} articles: {exc}")
+                complete = False
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        # Only remember fully parsed feeds, otherwise a 304 would keep serving the truncated result
+        if complete and (etag or last_modified):
+            _FEED_CACHE[cache_key] = (etag, last_modified, tuple(articles[:max_results]))
         return SearchResults(articles=articles[:max_results])
 
-    def get_search_results(self, topic: str, num_attempts: int = 3) -> Optional[SearchResults]:
+    async def _hedged_search(self, topic: str) -> SearchResults:
+        """Search Google News, racing a second request against the first if it is slow to respond."""
+        tasks = {asyncio.create_task(self._search_google_news_rss(topic))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.search_hedge_delay)
+            if not done:
+                tasks.add(asyncio.create_task(self._search_google_news_rss(topic)))
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_search_results(self, topic: str, num_attempts: int = 3) -> Optional[SearchResults]:
+        deadline = time.monotonic() + self.search_retry_deadline
+        backoff = 0.5
         for attempt in range(num_attempts):
             try:
-                search_results = self._search_google_news_rss(topic)
+                search_results = await self._hedged_search(topic)
                 article_count = len(search_results.articles)
                 if article_count > 0:
                     logger.info(f"Found {article_count} articles on attempt {attempt + 1}")
@@ -122,61 +276,179 @@ class BlogPostGenerator(Workflow):
                 logger.warning(f"Attempt {attempt + 1}/{num_attempts} failed: No articles found")
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
-                time.sleep(min(2 * (attempt + 1), 5))
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"Failed to get search results: retry deadline hit after {attempt + 1} attempts")
+                    return None
+                if attempt + 1 < num_attempts:
+                    # Exponential backoff with jitter so concurrent runs don't retry in lockstep
+                    await asyncio.sleep(min(backoff + random.uniform(0, backoff), remaining))
+                    backoff *= 2
 
         logger.error(f"Failed to get search results after {num_attempts} attempts")
         return None
 
-    def scrape_articles(self, topic: str, search_results: SearchResults) -> Dict[str, ScrapedArticle]:
+    async def scrape_articles(self, topic: str, search_results: SearchResults) -> Dict[str, ScrapedArticle]:
         scraped_articles: Dict[str, ScrapedArticle] = {}
+        queue: asyncio.Queue[NewsArticle] = asyncio.Queue()
+        queued_urls: set[str] = set()
         for article in search_results.articles:
-            if article.url in scraped_articles:
+            canonical_url = _canonical_url(article.url)
+            if canonical_url in queued_urls:
                 logger.info(f"Found scraped article in cache: {article.url}")
                 continue
+            queued_urls.add(canonical_url)
+            cached_article = _SCRAPE_CACHE.get(canonical_url)
+            if cached_article is not None:
+                logger.info(f"Found scraped article in cache: {article.url}")
+                scraped_articles[article.url] = cached_article
+                continue
+            queue.put_nowait(article)
 
-            article_scraper_response: RunResponse = self.article_scraper.run(article)
-            if (
-                article_scraper_response is not None
-                and article_scraper_response.content is not None
-                and isinstance(article_scraper_response.content, ScrapedArticle)
-            ):
-                scraped_articles[article_scraper_response.content.url] = article_scraper_response.content
-                logger.info(f"Scraped article: {article_scraper_response.content.url}")
-                if not article_scraper_response.content.content:
-                    logger.warning(f"No readable content found for article: {article.url}")
-            else:
-                logger.warning(f"Skipping article due to scrape failure: {article.url}")
-        return scraped_articles
+        async def worker() -> None:
+            while True:
+                try:
+                    article = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    article_scraper_response: RunResponse = await self.article_scraper.arun(article, self.http_client)
+                except Exception as exc:
+                    logger.warning(f"Skipping article due to scrape failure: {article.url} ({exc})")
+                    continue
+                if (
+                    article_scraper_response is not None
+                    and article_scraper_response.content is not None
+                    and isinstance(article_scraper_response.content, ScrapedArticle)
+                ):
+                    scraped_article = self._compact_article(article_scraper_response.content)
+                    # The scraper reports failures as articles without content; leave those out so the
+                    # writer only sees real context and run() can fall back to the RSS summaries
+                    if scraped_article.content:
+                        scraped_articles[article.url] = scraped_article
+                        _SCRAPE_CACHE[_canonical_url(article.url)] = scraped_article
+                        logger.info(f"Scraped article: {scraped_article.url}")
+                    else:
+                        logger.warning(f"No readable content found for article: {article.url}")
+                else:
+                    logger.warning(f"Skipping article due to scrape failure: {article.url}")
 
-    def run(
+        num_workers = min(self.max_concurrent_scrapes, queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
+        # Workers finish in arbitrary order; restore search rank so the writer prompt is deterministic
+        return {
+            article.url: scraped_articles[article.url]
+            for article in search_results.articles
+            if article.url in scraped_articles
+        }
+
+    def _build_writer_input(
         self,
         topic: str,
-        style_guidelines: Optional[str] = None,
-        include_sources: bool = True,
-    ) -> Iterator[RunResponse]:
-        """Run the blog post generation workflow."""
+        style_guidelines: str,
+        include_sources: bool,
+        scraped_articles: Dict[str, ScrapedArticle],
+    ) -> str:
+        """Build the writer prompt: the request fields on the first line, then one JSON line per article."""
+        # Articles go last, in search rank order, so related prompts share a cacheable prefix
+        request = {
+            "topic": topic,
+            "style_guidelines": style_guidelines,
+            "include_sources": include_sources,
+        }
+        articles = self._prepare_writer_articles(scraped_articles.values())
+        return "\n".join([orjson.dumps(request).decode(), *(article.compact_json for article in articles)])
+
+    def _compact_article(self, article: ScrapedArticle) -> ScrapedArticle:
+        """Collapse whitespace and trim the body once, before the article is cached."""
+        content = " ".join(article.content.split())[: self.max_article_chars] if article.content else None
+        if content == article.content:
+            return article
+        return article.model_copy(update={"content": content})
+
+    def _prepare_writer_articles(self, articles: Iterable[ScrapedArticle]) -> list[ScrapedArticle]:
+        """Drop near-duplicates so the writer prompt stays small."""
+        prepared: list[ScrapedArticle] = []
+        for article in articles:
+            content = article.content
+            if content and any(self._is_near_duplicate(content, other.content) for other in prepared if other.content):
+                logger.info(f"Skipping near-duplicate article: {article.url}")
+                continue
+            prepared.append(article)
+        return prepared
+
+    def _is_near_duplicate(self, content: str, other_content: str) -> bool:
+        # Compare the opening words; cheap upper bounds first since ratio() is quadratic in the worst case
+        matcher = SequenceMatcher(None, content[:500].split(), other_content[:500].split(), autojunk=False)
+        return (
+            matcher.real_quick_ratio() > self.near_duplicate_ratio
+            and matcher.quick_ratio() > self.near_duplicate_ratio
+            and matcher.ratio() > self.near_duplicate_ratio
+        )
+
+    def _is_similar_query(self, query: str, other_query: str) -> bool:
+        """Whether two search queries share enough words (Jaccard overlap) to return the same news."""
+        tokens = set(query.lower().split())
+        other_tokens = set(other_query.lower().split())
+        if not tokens or not other_tokens:
+            return tokens == other_tokens
+        return len(tokens & other_tokens) / len(tokens | other_tokens) > self.similar_query_overlap
+
+    def _can_reuse_topic_search(self, cleaned_topic: str) -> bool:
+        # A planned query made only of topic words still can't pass the overlap threshold once the topic
+        # has many more words than the planner may use, so searching the topic would be wasted
+        return self.planned_query_max_words > self.similar_query_overlap * len(set(cleaned_topic.lower().split()))
+
+    async def _search_and_scrape(
+        self, raw_topic: str, cleaned_topic: str, style_guidelines: str
+    ) -> Tuple[Optional[SearchResults], Dict[str, ScrapedArticle]]:
+        """Search for articles and scrape them, overlapping the query planner with a speculative search."""
+        if self.query_planner and self._should_use_query_planner(raw_topic):
+            speculative_search = None
+            if self._can_reuse_topic_search(cleaned_topic):
+                # The planner often returns a close variant of the topic, so start searching for it right away
+                speculative_search = asyncio.create_task(self.get_search_results(cleaned_topic))
+            search_query = await asyncio.to_thread(self._build_search_query, raw_topic, cleaned_topic, style_guidelines)
+            if speculative_search is not None and self._is_similar_query(search_query, cleaned_topic):
+                search_results = await speculative_search
+            else:
+                if speculative_search is not None:
+                    speculative_search.cancel()
+                search_results = await self.get_search_results(search_query)
+        else:
+            search_results = await self.get_search_results(cleaned_topic)
+
+        if search_results is None or len(search_results.articles) == 0:
+            return search_results, {}
+        return search_results, await self.scrape_articles(cleaned_topic, search_results)
+
+    async def _research(
+        self, topic: str, style_guidelines: Optional[str], include_sources: bool
+    ) -> Union[str, RunResponse]:
+        """Research the topic and build the writer input, or return the response that ends the run early."""
         raw_topic = topic or ""
         cleaned_topic = self._sanitize_user_text(raw_topic, max_length=600)
         if not cleaned_topic:
-            yield RunResponse(content="Please provide a topic or some ideas to get started.")
-            return
+            return RunResponse(content="Please provide a topic or some ideas to get started.")
         cleaned_guidelines = self._sanitize_user_text(style_guidelines or "", max_length=1500)
         logger.info(f"Generating a blog post on: {cleaned_topic}")
 
-        # Search the web for articles on the topic
-        search_query = self._build_search_query(raw_topic, cleaned_topic, cleaned_guidelines)
-        search_results: Optional[SearchResults] = self.get_search_results(search_query)
+        # Search the web for articles on the topic and scrape them
+        search_results, scraped_articles = await self._search_and_scrape(raw_topic, cleaned_topic, cleaned_guidelines)
         # If no search_results are found for the topic, end the workflow
         if search_results is None or len(search_results.articles) == 0:
-            yield RunResponse(
+            return RunResponse(
                 content=f"Sorry, could not find any articles on the topic: {cleaned_topic}",
             )
-            return
 
-        # Scrape the search results
-        scraped_articles: Dict[str, ScrapedArticle] = self.scrape_articles(cleaned_topic, search_results)
         if not scraped_articles:
             logger.warning("No articles scraped successfully. Falling back to RSS summaries only.")
+            # Title-only entries add prompt tokens without context, so keep the most detailed summaries
+            summarized = sorted(
+                (article for article in search_results.articles if article.summary),
+                key=lambda article: len(article.summary),
+                reverse=True,
+            )
             scraped_articles = {
                 article.url: ScrapedArticle(
                     title=article.title,
@@ -184,16 +456,64 @@ class BlogPostGenerator(Workflow):
                     summary=article.summary,
                     content=None,
                 )
-                for article in search_results.articles
+                for article in summarized[: self.max_fallback_articles]
             }
+            if not scraped_articles:
+                return RunResponse(
+                    content=f"Sorry, could not read any of the articles found on the topic: {cleaned_topic}",
+                )
 
         # Prepare the input for the writer
-        writer_input = {
-            "topic": cleaned_topic,
-            "style_guidelines": cleaned_guidelines,
-            "include_sources": include_sources,
-            "articles": [v.model_dump() for v in scraped_articles.values()],
-        }
+        return self._build_writer_input(cleaned_topic, cleaned_guidelines, include_sources, scraped_articles)
+
+    def run(
+        self,
+        topic: str,
+        style_guidelines: Optional[str] = None,
+        include_sources: bool = True,
+    ) -> Iterator[RunResponse]:
+        """Run the blog post generation workflow."""
+        writer_input = run_sync(self._research(topic, style_guidelines, include_sources))
+        if isinstance(writer_input, RunResponse):
+            yield writer_input
+            return
 
         # Run the writer and yield the response
-        yield from self.writer.run(json.dumps(writer_input, indent=4), stream=True)
+        yield from self.writer.run(writer_input, stream=True)
+
+    async def run_async(
+        self,
+        topic: str,
+        style_guidelines: Optional[str] = None,
+        include_sources: bool = True,
+    ) -> AsyncIterator[RunResponse]:
+        """Run the blog post generation workflow from an async caller."""
+        # Not named arun, which agno would route the sync run() through. agno's arun_workflow reads the
+        # run body from _subclass_run, so point it at the async body for this call; events then get the
+        # same run ids, memory and storage bookkeeping as run()
+        sync_run = self._subclass_run
+        self._subclass_run = self._start_async_run
+        try:
+            responses = await self.arun_workflow(
+                topic=topic, style_guidelines=style_guidelines, include_sources=include_sources
+            )
+        finally:
+            self._subclass_run = sync_run
+        async for response in responses:
+            yield response
+
+    async def _start_async_run(self, **kwargs) -> AsyncIterator[RunResponse]:
+        return self._stream_async_run(**kwargs)
+
+    async def _stream_async_run(
+        self, topic: str, style_guidelines: Optional[str], include_sources: bool
+    ) -> AsyncIterator[RunResponse]:
+        # Research stays on the shared I/O loop that owns the pooled HTTP client; only the writer
+        # streams on the caller's loop
+        writer_input = await run_on_io_loop(self._research(topic, style_guidelines, include_sources))
+        if isinstance(writer_input, RunResponse):
+            yield writer_input
+            return
+
+        async for response in await self.writer.arun(writer_input, stream=True):
+            yield response
@@ -0,0 +1,117 @@
+import asyncio
+import importlib.util
+import ipaddress
+import os
+import socket
+import threading
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+from urllib.request import getproxies
+
+import httpx
+from cachetools import TTLCache, cached
+
+USER_AGENT = "Mozilla/5.0 (compatible; AI-Blog-Generator/1.0; +https://example.com)"
+CONNECT_RETRIES = 2
+# Set to 1 to memoise DNS lookups process-wide; off by default since it patches socket.getaddrinfo
+DNS_CACHE_ENV_VAR = "AI_BLOG_GENERATOR_DNS_CACHE"
+DNS_CACHE_TTL_SECONDS = 300
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def _install_dns_cache() -> None:
+    """Serve repeat getaddrinfo calls from memory so reconnects to the same hosts skip the lookup"""
+    resolve = socket.getaddrinfo
+    # Short TTL so hosts that move are picked up again; failed lookups are never cached
+    socket.getaddrinfo = cached(TTLCache(maxsize=256, ttl=DNS_CACHE_TTL_SECONDS), lock=threading.Lock())(resolve)
+
+
+if os.environ.get(DNS_CACHE_ENV_VAR) == "1":
+    _install_dns_cache()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop that owns all network I/O, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ai-blog-generator-io", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared I/O loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def run_on_io_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Await a coroutine on the shared I/O loop from another event loop"""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_loop()))
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_network(host, strict=False)
+    except ValueError:
+        return False
+    return True
+
+
+def _environment_proxy_mounts(**transport_options: Any) -> Dict[str, Optional[httpx.AsyncHTTPTransport]]:
+    """Map HTTP(S)_PROXY, ALL_PROXY and NO_PROXY to client mounts the way httpx does for a default client.
+
+    httpx skips the environment once a transport is passed explicitly, so the client rebuilds the mounts
+    itself. Proxied transports get the same options, though httpx only applies connect retries to direct
+    connections.
+    """
+    proxies = getproxies()
+    no_proxy = [host.strip() for host in proxies.get("no", "").split(",") if host.strip()]
+    if "*" in no_proxy:
+        return {}
+    mounts: Dict[str, Optional[httpx.AsyncHTTPTransport]] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy := proxies.get(scheme):
+            proxy_url = proxy if "://" in proxy else f"http://{proxy}"
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(proxy=proxy_url, **transport_options)
+    # A None mount sends matching hosts through the client's direct transport
+    for host in no_proxy:
+        if "://" in host:
+            mounts[host] = None
+        elif host.lower() == "localhost" or _is_ip_address(host):
+            mounts[f"all://[{host}]" if ":" in host else f"all://{host}"] = None
+        else:
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client shared by search and scraping.
+
+    The client keeps connections alive between requests and workflow runs, so it
+    must only be used from coroutines running on the shared I/O loop (see run_sync).
+    """
+    global _client
+    # Generators are created on Gradio worker threads, so two first requests can race here
+    with _client_lock:
+        if _client is None:
+            transport_options = dict(
+                http2=importlib.util.find_spec("h2") is not None,
+                # Keep idle connections well past httpx's 5 s default so later searches and runs reuse them
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=120.0),
+                # Retry failed connects only; a request that already reached the server is never replayed
+                retries=CONNECT_RETRIES,
+            )
+            _client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(**transport_options),
+                mounts=_environment_proxy_mounts(**transport_options),
+                timeout=10.0,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+            )
+    return _client
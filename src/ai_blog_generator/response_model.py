@@ -1,6 +1,7 @@
-from typing import Optional
+from functools import cached_property
+from typing import Any, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NewsArticle(BaseModel):
@@ -14,6 +15,9 @@ class SearchResults(BaseModel):
 
 
 class ScrapedArticle(BaseModel):
+    # Frozen so the memoised compact_json can't go stale through attribute assignment
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Title of the article.")
     url: str = Field(..., description="Link to the article.")
     summary: Optional[str] = Field(..., description="Summary of the article if available.")
@@ -21,3 +25,14 @@ class ScrapedArticle(BaseModel):
         ...,
         description="Full article content in markdown format. None if content is unavailable.",
     )
+
+    @cached_property
+    def compact_json(self) -> str:
+        # Cached articles serialise once per lifetime
+        return self.model_dump_json()
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "ScrapedArticle":
+        copied = super().model_copy(update=update, deep=deep)
+        # Copies carry the instance dict over, including the dump memoised for the original
+        copied.__dict__.pop("compact_json", None)
+        return copied
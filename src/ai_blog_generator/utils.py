@@ -1,15 +1,22 @@
+from types import MappingProxyType
+from typing import Final, Mapping
+
+_DEFAULT_LLMS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "OpenAI": "gpt-4o",
+        "Gemini": "gemini-2.0-flash",
+        "Claude": "claude-3-5-sonnet-20241022",
+        "Grok": "grok-beta",
+    }
+)
+
+
 def get_default_llm(provider: str) -> str:
     """Get the default LLM name based on the provider"""
-    if provider == "OpenAI":
-        return "gpt-4o"
-    elif provider == "Gemini":
-        return "gemini-2.0-flash"
-    elif provider == "Claude":
-        return "claude-3-5-sonnet-20241022"
-    elif provider == "Grok":
-        return "grok-beta"
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+    try:
+        return _DEFAULT_LLMS[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported provider: {provider}") from None
 
 
 example_prompts = [